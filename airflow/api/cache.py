@@ -0,0 +1,96 @@
+"""
+HTTP validator cache for the GitLab API client.
+
+This module holds the ``ETag``/``Last-Modified`` validators (and the pagination
+headers needed to walk a listing) of previously stored listing pages, keyed by
+request URL, so a run can issue conditional GETs and skip pages that have not
+changed. The validators themselves are persisted in the application database
+next to the projects they describe.
+"""
+
+import httpx
+
+# Response headers kept for each cached request
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'X-Total-Pages', 'X-Next-Page')
+
+
+class ResponseValidatorCache:
+    """In-memory view of stored response validators keyed by request URL and parameters."""
+    
+    def __init__(self, validators=None):
+        """
+        Initialize the cache.
+        
+        Args:
+            validators (dict, optional): Cached response headers keyed by
+                ``ResponseValidatorCache.key``
+        """
+        self._validators = dict(validators or {})
+    
+    @staticmethod
+    def key(url, params=None):
+        """Build a cache key from the fully encoded request URL."""
+        return str(httpx.URL(url, params=params))
+    
+    @staticmethod
+    def validators(headers):
+        """
+        Select the headers worth caching from a successful response.
+        
+        Args:
+            headers (Mapping): Response headers
+            
+        Returns:
+            dict: Cached response headers, or None if the response has no
+            ``ETag`` or ``Last-Modified`` header
+        """
+        cached = {name: headers[name] for name in CACHED_HEADERS if headers.get(name)}
+        if 'ETag' not in cached and 'Last-Modified' not in cached:
+            return None
+        return cached
+    
+    @staticmethod
+    def conditional_headers(cached):
+        """
+        Build conditional request headers from cached response headers.
+        
+        Args:
+            cached (dict): Cached response headers, or None
+            
+        Returns:
+            dict: ``If-None-Match``/``If-Modified-Since`` request headers
+        """
+        headers = {}
+        if cached:
+            if 'ETag' in cached:
+                headers['If-None-Match'] = cached['ETag']
+            if 'Last-Modified' in cached:
+                headers['If-Modified-Since'] = cached['Last-Modified']
+        return headers
+    
+    @staticmethod
+    def revalidated_headers(cached, headers):
+        """
+        Merge the headers of a ``304 Not Modified`` response over cached ones.
+        
+        Args:
+            cached (dict): Cached response headers
+            headers (Mapping): Headers of the 304 response
+            
+        Returns:
+            dict: Cached headers updated with any fresh values the server sent
+        """
+        return {**cached, **{name: headers[name] for name in CACHED_HEADERS if headers.get(name)}}
+    
+    def get(self, url, params=None):
+        """
+        Get the cached headers for a request.
+        
+        Args:
+            url (str): Request URL
+            params (dict, optional): Query parameters
+            
+        Returns:
+            dict: Cached response headers, or None if the request is not cached
+        """
+        return self._validators.get(self.key(url, params))
@@ -1,16 +1,182 @@
 import sys
 import argparse
+import asyncio
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
 from utils.logger import setup_logger
 from database.models import init_db
 from database.operations import ProjectRepository
-from api.client import GitLabApiClient
+from api.async_client import AsyncGitLabApiClient
+from api.cache import ResponseValidatorCache
 from config import DATABASE_URI
 from datetime import datetime
 
 # Set up logging
 logger = setup_logger()
 
+# Number of projects written to the database per batch
+BATCH_SIZE = 500
+
+@lru_cache(maxsize=1)
+def get_repo():
+    """
+    Return the process-wide project repository used by the CLI commands.
+    
+    Returns:
+        ProjectRepository: Repository bound to a session on DATABASE_URI
+    """
+    return ProjectRepository(init_db(DATABASE_URI))
+
+@contextmanager
+def task_repo():
+    """
+    Provide a project repository for a single task run.
+    
+    The session is closed on exit so its connection returns to the engine's
+    pool between scheduled runs.
+    
+    Yields:
+        ProjectRepository: Repository bound to a new session on DATABASE_URI
+    """
+    session = init_db(DATABASE_URI)
+    try:
+        yield ProjectRepository(session)
+    finally:
+        session.close()
+
+def _store_projects(project_repo, projects):
+    """
+    Store a batch of projects in the database.
+    
+    If the batch cannot be written as a whole, its projects are stored one at
+    a time so a single bad row only loses that project.
+    
+    Args:
+        project_repo (ProjectRepository): Project repository
+        projects (list): List of project dictionaries from the GitLab API
+        
+    Returns:
+        tuple: Number of projects stored successfully, and whether every
+        project in the batch was stored
+    """
+    try:
+        return project_repo.bulk_save_projects(projects), True
+    except Exception as e:
+        logger.error(f"Error processing batch of {len(projects)} projects: {str(e)}")
+    
+    # Fall back to one project per transaction
+    project_count = 0
+    stored_all = True
+    for project_data in projects:
+        try:
+            project_count += project_repo.bulk_save_projects([project_data])
+        except Exception as e:
+            logger.error(f"Error processing project {project_data.get('id')}: {str(e)}")
+            stored_all = False
+            # Continue with next project
+    return project_count, stored_all
+
+def _store_pages(project_repo, pages):
+    """
+    Store the projects of a batch of pages, then record the pages' validators.
+    
+    Validators are only stored once every project of the batch has been
+    committed, so pages that failed or were never saved are fetched again
+    on the next run instead of being skipped as unchanged.
+    
+    Args:
+        project_repo (ProjectRepository): Project repository
+        pages (list): ProjectPage tuples from the API client
+        
+    Returns:
+        int: Number of projects stored successfully
+    """
+    projects = [project_data for page in pages for project_data in page.projects]
+    project_count, stored_all = _store_projects(project_repo, projects)
+    if not stored_all:
+        return project_count
+    
+    validator_rows = []
+    for page in pages:
+        validators = ResponseValidatorCache.validators(page.headers) if page.cacheable else None
+        if validators is not None:
+            validator_rows.append({
+                'key': ResponseValidatorCache.key(page.url, page.params),
+                'headers': validators,
+                'project_ids': [project_data['id'] for project_data in page.projects],
+            })
+    try:
+        project_repo.save_page_validators(validator_rows)
+    except Exception as e:
+        # The pages are simply fetched in full again next run
+        logger.error(f"Error saving validators for {len(validator_rows)} pages: {str(e)}")
+    return project_count
+
+async def _fetch_all(project_repo, response_cache):
+    """
+    Fetch all projects concurrently and store them in batches.
+    
+    A producer coroutine downloads pages and pushes them onto a bounded
+    queue; a writer coroutine drains it in batches of at least BATCH_SIZE
+    projects, running the blocking database writes in a worker thread so
+    downloads keep flowing.
+    
+    Args:
+        project_repo (ProjectRepository): Project repository
+        response_cache (ResponseValidatorCache): Validators loaded from the database
+        
+    Returns:
+        int: Number of projects processed
+    """
+    # Room for about four batches of 100-project pages
+    queue = asyncio.Queue(maxsize=BATCH_SIZE * 4 // 100)
+    
+    async def produce():
+        try:
+            async with AsyncGitLabApiClient(cache=response_cache) as api_client:
+                logger.info("Fetching projects from GitLab API")
+                async for page in api_client.iter_project_pages():
+                    await queue.put(page)
+        except asyncio.CancelledError:
+            # Cancelled because the writer failed; nothing is left to drain
+            # the queue, so don't wait to hand it the end marker
+            raise
+        except BaseException:
+            await queue.put(None)
+            raise
+        # Signal the writer that no more pages are coming
+        await queue.put(None)
+    
+    async def write():
+        project_count = 0
+        pages = []
+        batch_size = 0
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
+            pages.append(page)
+            batch_size += len(page.projects)
+            if batch_size >= BATCH_SIZE:
+                project_count += await asyncio.to_thread(_store_pages, project_repo, pages)
+                pages = []
+                batch_size = 0
+        
+        if pages:
+            project_count += await asyncio.to_thread(_store_pages, project_repo, pages)
+        return project_count
+    
+    producer = asyncio.ensure_future(produce())
+    try:
+        project_count = await write()
+    except BaseException:
+        # Stop downloading, otherwise the producer blocks on the full queue
+        producer.cancel()
+        raise
+    await producer
+    return project_count
+
 def fetch_and_store_projects():
     """
     Fetch projects from GitLab API and store them in the database.
@@ -23,35 +189,10 @@ def fetch_and_store_projects():
         
         # Initialize database
         logger.info(f"Initializing database connection to {DATABASE_URI}")
-        session = init_db(DATABASE_URI)
-        project_repo = ProjectRepository(session)
-        
-        # Initialize API client
-        api_client = GitLabApiClient()
-        
-        # Fetch projects
-        logger.info("Fetching projects from GitLab API")
-        projects = api_client.get_projects()
-        
-        # Store projects in database
-        project_count = 0
-        for project_data in projects:
-            try:
-                # Check if project already exists
-                existing_project = project_repo.get_project_by_id(project_data["id"])
-                
-                if existing_project:
-                    # Update existing project
-                    project_repo.update_project(project_data["id"], project_data)
-                else:
-                    # Create new project
-                    project_repo.create_project(project_data)
-                
-                project_count += 1
-            except Exception as e:
-                logger.error(f"Error processing project {project_data.get('id')}: {str(e)}")
-                # Continue with next project
-                continue
+        with task_repo() as project_repo:
+            # Fetch and store projects on an event loop
+            response_cache = ResponseValidatorCache(project_repo.load_page_validators())
+            project_count = asyncio.run(_fetch_all(project_repo, response_cache))
         
         logger.info(f"Successfully processed {project_count} projects")
         return project_count
@@ -65,26 +206,27 @@ def list_projects():
     List all projects in the database.
     """
     try:
-        # Initialize database
-        session = init_db(DATABASE_URI)
-        project_repo = ProjectRepository(session)
+        project_repo = get_repo()
         
-        # Get all projects
-        projects = project_repo.get_all_projects()
+        # Format one line per project from the summary columns only
+        row_format = '{:<6} {:<30} {:<12} {:<20}'.format
+        rows = [
+            row_format(
+                project_id,
+                name[:30],
+                visibility or "N/A",
+                last_activity_at.isoformat(sep=' ', timespec='minutes') if last_activity_at else "N/A"
+            )
+            for project_id, name, visibility, last_activity_at in project_repo.iter_project_summaries()
+        ]
         
-        if not projects:
+        if not rows:
             print("No projects found in the database.")
             return
         
-        # Print project information
-        print(f"\n{'ID':<6} {'Name':<30} {'Visibility':<12} {'Last Activity':<20}")
-        print("-" * 70)
-        
-        for project in projects:
-            last_activity = project.last_activity_at.strftime('%Y-%m-%d %H:%M') if project.last_activity_at else "N/A"
-            print(f"{project.id:<6} {project.name[:30]:<30} {project.visibility:<12} {last_activity:<20}")
-        
-        print(f"\nTotal: {len(projects)} projects")
+        # Print project information in a single write
+        header = row_format('ID', 'Name', 'Visibility', 'Last Activity')
+        sys.stdout.write('\n'.join(['', header, '-' * 70, *rows, '', f"Total: {len(rows)} projects"]) + '\n')
         
     except Exception as e:
         logger.exception(f"Error listing projects: {str(e)}")
@@ -98,9 +240,7 @@ def show_project(project_id):
         project_id (int): Project ID
     """
     try:
-        # Initialize database
-        session = init_db(DATABASE_URI)
-        project_repo = ProjectRepository(session)
+        project_repo = get_repo()
         
         # Get project
         project = project_repo.get_project_by_id(project_id)
@@ -142,9 +282,7 @@ def update_project(project_id):
         project_id (int): Project ID
     """
     try:
-        # Initialize database
-        session = init_db(DATABASE_URI)
-        project_repo = ProjectRepository(session)
+        project_repo = get_repo()
         
         # Get project first to confirm it exists
         project = project_repo.get_project_by_id(project_id)
@@ -195,9 +333,7 @@ def delete_project(project_id):
         project_id (int): Project ID
     """
     try:
-        # Initialize database
-        session = init_db(DATABASE_URI)
-        project_repo = ProjectRepository(session)
+        project_repo = get_repo()
         
         # Get project first to confirm it exists
         project = project_repo.get_project_by_id(project_id)
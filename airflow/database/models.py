@@ -4,15 +4,35 @@ Database models for the GitLab API data extraction application.
 This module defines the SQLAlchemy ORM models used to store GitLab data.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, create_engine, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, create_engine, ForeignKey, Index, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 # Create base class for declarative models
 Base = declarative_base()
 
+# PRAGMAs applied to every SQLite connection to speed up the insert path
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Apply SQLITE_PRAGMAS to a new DBAPI connection."""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 class Project(Base):
     """SQLAlchemy model for GitLab projects."""
     
@@ -54,6 +74,12 @@ class Project(Base):
     # Relationships
     namespaces = relationship("Namespace", back_populates="project", cascade="all, delete-orphan")
     
+    # Secondary indexes for listing by activity and filtering by visibility
+    __table_args__ = (
+        Index('ix_projects_last_activity_at', 'last_activity_at'),
+        Index('ix_projects_visibility', 'visibility'),
+    )
+    
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}')>"
 
@@ -86,6 +112,85 @@ class Namespace(Base):
         return f"<Namespace(id={self.id}, name='{self.name}')>"
 
 
+class PageValidator(Base):
+    """SQLAlchemy model for the HTTP validators of stored project listing pages."""
+    
+    __tablename__ = 'page_validators'
+    
+    # Fully encoded request URL of the page
+    key = Column(String(1024), primary_key=True)
+    
+    # Cached response headers (ETag, Last-Modified and pagination headers)
+    headers = Column(JSON, nullable=False)
+    
+    # IDs of the projects the page held when it was stored
+    project_ids = Column(JSON, nullable=False)
+    
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<PageValidator(key='{self.key}')>"
+
+
+@lru_cache(maxsize=4)
+def _get_engine(db_uri):
+    """
+    Create the engine for a database URI and create tables if they don't exist.
+    
+    Engines are cached per URI, so the connection pool and schema check are
+    shared by every caller in the process.
+    
+    Args:
+        db_uri (str): Database connection URI
+        
+    Returns:
+        sqlalchemy.engine.Engine: Database engine
+    """
+    logger = logging.getLogger('gitlab_api.database')
+    
+    is_sqlite = db_uri.startswith('sqlite')
+    
+    # Create engine with appropriate security settings
+    engine = create_engine(
+        db_uri, 
+        echo=False,  # Set to False in production for security
+        pool_pre_ping=True,  # Verify connections before use
+        future=True,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+        # SQLite file databases use a pool that does not accept sizing arguments
+        **({} if is_sqlite else {"pool_size": 5, "max_overflow": 10})
+    )
+    
+    if is_sqlite:
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    
+    # Create all tables
+    Base.metadata.create_all(engine)
+    
+    # create_all skips existing tables entirely, so add indexes introduced later
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    
+    logger.info(f"Database successfully initialized with URI: {db_uri}")
+    return engine
+
+
+@lru_cache(maxsize=4)
+def _get_sessionmaker(db_uri):
+    """
+    Return the cached session factory bound to the engine for a database URI.
+    
+    Args:
+        db_uri (str): Database connection URI
+        
+    Returns:
+        sqlalchemy.orm.sessionmaker: Session factory
+    """
+    return sessionmaker(bind=_get_engine(db_uri))
+
+
 def init_db(db_uri):
     """
     Initialize the database, create tables if they don't exist, and return a session.
@@ -99,24 +204,8 @@ def init_db(db_uri):
     logger = logging.getLogger('gitlab_api.database')
     
     try:
-        # Create engine with appropriate security settings
-        engine = create_engine(
-            db_uri, 
-            echo=False,  # Set to False in production for security
-            pool_pre_ping=True,  # Verify connections before use
-            connect_args={"check_same_thread": False} if db_uri.startswith('sqlite') else {}
-        )
-        
-        # Create all tables
-        Base.metadata.create_all(engine)
-        
-        # Create session
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        
-        logger.info(f"Database successfully initialized with URI: {db_uri}")
-        return session
+        return _get_sessionmaker(db_uri)()
     
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
-        raise
\ No newline at end of file
+        raise
@@ -4,13 +4,122 @@ Database operations for the GitLab API data extraction application.
 This module provides a repository class with CRUD operations for GitLab data.
 """
 
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
 import logging
-from database.models import Project, Namespace
+import ciso8601
+from database.models import Project, Namespace, PageValidator
 
 logger = logging.getLogger('gitlab_api.database')
 
+# Project fields that GitLab returns as ISO 8601 strings
+_DATETIME_FIELDS = ('created_at', 'last_activity_at', 'updated_at')
+
+# Column names accepted from GitLab API payloads
+_PROJECT_COLS = frozenset(column.name for column in Project.__table__.columns)
+_NAMESPACE_COLS = frozenset(column.name for column in Namespace.__table__.columns) - {'project_id'}
+
+
+def _parse_dt(value):
+    """
+    Parse an ISO 8601 timestamp from the GitLab API.
+    
+    Args:
+        value (str | datetime | None): Timestamp string or already parsed value
+        
+    Returns:
+        datetime: Parsed datetime, the value itself if it is not a string,
+        or None for an empty string
+    """
+    if not isinstance(value, str):
+        return value
+    if not value:
+        return None
+    return ciso8601.parse_datetime(value)
+
+
+def _compile_project_row_builder():
+    """
+    Generate a row builder specialized to the columns of the Project model.
+    
+    The generated ``build_project_row(d, now=None)`` maps a GitLab project
+    payload to a projects table row with every column spelled out, so no
+    per-row filtering or datetime-field loop is needed. Missing keys take the
+    column's default (callable defaults, which are all timestamps, take
+    ``now``) and ``last_synced`` is always set to ``now``.
+    
+    Returns:
+        function: The generated ``build_project_row`` function
+    """
+    lines = []
+    for column in Project.__table__.columns:
+        name = column.name
+        if name == 'last_synced':
+            lines.append(f"        {name!r}: now,")
+            continue
+        
+        if column.default is None:
+            expr = f"d.get({name!r})"
+        elif column.default.is_callable:
+            expr = f"d.get({name!r}, now)"
+        else:
+            expr = f"d.get({name!r}, {column.default.arg!r})"
+        if name in _DATETIME_FIELDS:
+            expr = f"_parse({expr})"
+        lines.append(f"        {name!r}: {expr},")
+    
+    source = (
+        "def build_project_row(d, now=None):\n"
+        "    if now is None:\n"
+        "        now = _utcnow()\n"
+        "    return {\n"
+        + "\n".join(lines) +
+        "\n    }\n"
+    )
+    namespace = {'_parse': _parse_dt, '_utcnow': datetime.utcnow}
+    exec(compile(source, '<build_project_row>', 'exec'), namespace)
+    return namespace['build_project_row']
+
+
+build_project_row = _compile_project_row_builder()
+
+
+def _namespace_rows(projects):
+    """
+    Collect namespaces table rows from a batch of GitLab project payloads.
+    
+    Args:
+        projects (iterable): Project dictionaries from GitLab API
+        
+    Returns:
+        dict: Namespace rows keyed by ID; a namespace shared by several
+        projects is attributed to the first one seen
+    """
+    namespace_rows = {}
+    for project_data in projects:
+        namespace_data = project_data.get('namespace')
+        if namespace_data and namespace_data.get('id') not in namespace_rows:
+            namespace_row = {k: v for k, v in namespace_data.items() if k in _NAMESPACE_COLS}
+            namespace_row['project_id'] = project_data['id']
+            namespace_rows[namespace_row['id']] = namespace_row
+    return namespace_rows
+
+
+def _uniform_rows(rows):
+    """
+    Give every row the same keys, as multi-row statements require.
+    
+    Args:
+        rows (iterable): Row dictionaries
+        
+    Returns:
+        list: Row dictionaries with missing keys set to None
+    """
+    rows = list(rows)
+    columns = set().union(*rows)
+    return [{col: row.get(col) for col in columns} for row in rows]
+
 class ProjectRepository:
     """Repository class for database operations on Project objects."""
     
@@ -37,26 +146,11 @@ class ProjectRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            # Handle datetime fields
-            for date_field in ['created_at', 'last_activity_at', 'updated_at']:
-                if date_field in project_data and project_data[date_field]:
-                    # Handle ISO format strings
-                    if isinstance(project_data[date_field], str):
-                        project_data[date_field] = datetime.fromisoformat(
-                            project_data[date_field].replace('Z', '+00:00')
-                        )
-            
             # Extract namespace data if present
-            namespace_data = None
-            if 'namespace' in project_data:
-                namespace_data = project_data.pop('namespace')
+            namespace_data = project_data.get('namespace')
             
-            # Filter data to only include fields in our model
-            valid_fields = [column.name for column in Project.__table__.columns]
-            filtered_data = {k: v for k, v in project_data.items() if k in valid_fields}
-            
-            # Add current timestamp for last_synced
-            filtered_data['last_synced'] = datetime.utcnow()
+            # Build a row of model fields with parsed timestamps and last_synced
+            filtered_data = build_project_row(project_data)
             
             # Create new project
             project = Project(**filtered_data)
@@ -86,8 +180,7 @@ class ProjectRepository:
         """
         try:
             # Filter namespace data
-            valid_fields = [column.name for column in Namespace.__table__.columns if column.name != 'project_id']
-            filtered_data = {k: v for k, v in namespace_data.items() if k in valid_fields}
+            filtered_data = {k: v for k, v in namespace_data.items() if k in _NAMESPACE_COLS}
 
             # Check if the namespace already exists
             existing_namespace = self.session.query(Namespace).filter_by(id=filtered_data["id"]).first()
@@ -97,7 +190,7 @@ class ProjectRepository:
                 namespace = Namespace(project=project, **filtered_data)
                 self.session.add(namespace)
             else:
-                logger.info(f"Namespace {existing_namespace.id} already exists. Skipping creation.")
+                logger.debug(f"Namespace {existing_namespace.id} already exists. Skipping creation.")
 
         except Exception as e:
             logger.error(f"Error adding namespace to project {project.id}: {str(e)}")
@@ -141,13 +234,9 @@ class ProjectRepository:
             project = self.get_project_by_id(project_id)
             if project:
                 # Handle datetime fields
-                for date_field in ['created_at', 'last_activity_at', 'updated_at']:
-                    if date_field in project_data and project_data[date_field]:
-                        # Handle ISO format strings
-                        if isinstance(project_data[date_field], str):
-                            project_data[date_field] = datetime.fromisoformat(
-                                project_data[date_field].replace('Z', '+00:00')
-                            )
+                for date_field in _DATETIME_FIELDS:
+                    if date_field in project_data:
+                        project_data[date_field] = _parse_dt(project_data[date_field])
                 
                 # Extract namespace data if present
                 namespace_data = None
@@ -155,8 +244,7 @@ class ProjectRepository:
                     namespace_data = project_data.pop('namespace')
                 
                 # Filter data to only include fields in our model
-                valid_fields = [column.name for column in Project.__table__.columns]
-                filtered_data = {k: v for k, v in project_data.items() if k in valid_fields}
+                filtered_data = {k: v for k, v in project_data.items() if k in _PROJECT_COLS}
                 
                 # Update project fields
                 for key, value in filtered_data.items():
@@ -164,9 +252,10 @@ class ProjectRepository:
                 
                 # Update namespace if needed
                 if namespace_data:
-                    # Remove existing namespaces
-                    for namespace in project.namespaces:
-                        self.session.delete(namespace)
+                    # Remove existing namespaces with one DELETE and reload the
+                    # collection lazily rather than cascading through the ORM
+                    self.session.execute(delete(Namespace).where(Namespace.project_id == project_id))
+                    self.session.expire(project, ['namespaces'])
                     
                     # Add new namespace
                     self._add_namespace(project, namespace_data)
@@ -230,3 +319,232 @@ class ProjectRepository:
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving all projects: {str(e)}")
             raise
+    
+    def iter_project_summaries(self):
+        """
+        Get the columns shown in project listings, without loading full ORM objects.
+        
+        Returns:
+            iterator: ``(id, name, visibility, last_activity_at)`` rows ordered by ID
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            return iter(self.session.execute(
+                select(Project.id, Project.name, Project.visibility, Project.last_activity_at)
+                .order_by(Project.id)
+            ))
+        except SQLAlchemyError as e:
+            logger.error(f"Error retrieving project summaries: {str(e)}")
+            raise
+    
+    def existing_ids(self, ids):
+        """
+        Find which of the given project IDs are already stored.
+        
+        Args:
+            ids (list): Project IDs
+            
+        Returns:
+            set: IDs of the projects that exist in the database
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            return set(self.session.scalars(select(Project.id).where(Project.id.in_(ids))).all())
+        except SQLAlchemyError as e:
+            logger.error(f"Error checking existing project IDs: {str(e)}")
+            raise
+    
+    def bulk_insert_projects(self, rows):
+        """
+        Insert new projects with a single executemany INSERT.
+        
+        Rows are built with ``build_project_row``, which keeps only model
+        columns and stamps last_synced.
+        Changes are not committed; the caller owns the transaction.
+        
+        Args:
+            rows (list): List of project dictionaries from GitLab API
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not rows:
+            return
+        
+        now = datetime.utcnow()
+        self.session.execute(
+            insert(Project),
+            [build_project_row(row, now) for row in rows]
+        )
+    
+    def bulk_update_projects(self, rows):
+        """
+        Update existing projects with a single executemany UPDATE keyed by ID.
+        
+        Rows are built with ``build_project_row``, which keeps only model
+        columns and stamps last_synced.
+        Changes are not committed; the caller owns the transaction.
+        
+        Args:
+            rows (list): List of project dictionaries from GitLab API
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not rows:
+            return
+        
+        now = datetime.utcnow()
+        params = [build_project_row(row, now) for row in rows]
+        
+        # The primary key is bound as b_id so "id" is not part of the SET clause
+        for row in params:
+            row['b_id'] = row.pop('id')
+        
+        self.session.execute(
+            update(Project.__table__).where(Project.__table__.c.id == bindparam('b_id')),
+            params
+        )
+    
+    def bulk_update_namespaces(self, rows):
+        """
+        Update existing namespaces with a single executemany UPDATE keyed by ID.
+        
+        The owning project_id is not changed.
+        Changes are not committed; the caller owns the transaction.
+        
+        Args:
+            rows (list): Namespace rows as built by ``_namespace_rows``
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not rows:
+            return
+        
+        params = _uniform_rows({k: v for k, v in row.items() if k != 'project_id'} for row in rows)
+        
+        # The primary key is bound as b_id so "id" is not part of the SET clause
+        for row in params:
+            row['b_id'] = row.pop('id')
+        
+        self.session.execute(
+            update(Namespace.__table__).where(Namespace.__table__.c.id == bindparam('b_id')),
+            params
+        )
+    
+    def bulk_save_projects(self, projects):
+        """
+        Create or update a batch of projects using one existence check.
+        
+        Existing project IDs are looked up with a single ``IN (...)`` query;
+        new projects are then inserted and existing ones updated with one
+        executemany statement each, and the batch is committed once.
+        Namespaces are saved the same way, so renamed namespaces are updated;
+        an existing namespace keeps the project it was first stored with.
+        
+        Args:
+            projects (list): List of project dictionaries from GitLab API
+            
+        Returns:
+            int: Number of projects written
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not projects:
+            return 0
+        
+        # Deduplicate by ID so a project is only written once per batch
+        payloads = {project_data['id']: project_data for project_data in projects}
+        namespace_rows = _namespace_rows(payloads.values())
+        
+        try:
+            have = self.existing_ids(list(payloads))
+            creates = [data for project_id, data in payloads.items() if project_id not in have]
+            updates = [data for project_id, data in payloads.items() if project_id in have]
+            
+            self.bulk_insert_projects(creates)
+            self.bulk_update_projects(updates)
+            
+            if namespace_rows:
+                have_namespaces = set(self.session.scalars(
+                    select(Namespace.id).where(Namespace.id.in_(list(namespace_rows)))
+                ).all())
+                new_namespaces = [row for namespace_id, row in namespace_rows.items()
+                                  if namespace_id not in have_namespaces]
+                if new_namespaces:
+                    self.session.execute(insert(Namespace), _uniform_rows(new_namespaces))
+                
+                changed_namespaces = [row for namespace_id, row in namespace_rows.items()
+                                      if namespace_id in have_namespaces]
+                if changed_namespaces:
+                    self.bulk_update_namespaces(changed_namespaces)
+            
+            # Commit the whole batch at once
+            self.session.commit()
+            logger.debug(f"Saved {len(payloads)} projects ({len(creates)} created, {len(updates)} updated)")
+            return len(payloads)
+            
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error saving projects: {str(e)}")
+            raise
+    
+    def load_page_validators(self):
+        """
+        Load the stored validators of project listing pages.
+        
+        A page's validators are only returned while every project it held is
+        still stored, so pages whose rows were deleted are fetched in full
+        again instead of being answered with ``304 Not Modified``.
+        
+        Returns:
+            dict: Cached response headers keyed by request URL
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            stored_ids = set(self.session.scalars(select(Project.id)))
+            return {
+                key: headers
+                for key, headers, project_ids in self.session.execute(
+                    select(PageValidator.key, PageValidator.headers, PageValidator.project_ids)
+                )
+                if stored_ids.issuperset(project_ids)
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"Error loading page validators: {str(e)}")
+            raise
+    
+    def save_page_validators(self, rows):
+        """
+        Store the validators of project listing pages, replacing older ones.
+        
+        Args:
+            rows (list): Dictionaries with the page ``key``, its cached
+                ``headers`` and the ``project_ids`` it held
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not rows:
+            return
+        
+        try:
+            self.session.execute(
+                delete(PageValidator).where(PageValidator.key.in_([row['key'] for row in rows]))
+            )
+            self.session.execute(insert(PageValidator), rows)
+            self.session.commit()
+            logger.debug(f"Saved validators for {len(rows)} pages")
+            
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error saving page validators: {str(e)}")
+            raise
@@ -1,13 +1,63 @@
 import os
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
 import sys
+import weakref
 from config import LOG_LEVEL, LOG_DIR
 
+
+class _ListenerQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that owns the QueueListener thread writing its records.
+    
+    Threads don't survive ``os.fork()``, so the listener is restarted in
+    child processes (e.g. Airflow task runners forked after the DAG file is
+    imported); closing the handler, as ``logging.shutdown()`` does, stops
+    the listener after the queued records are written.
+    """
+    
+    def __init__(self, *handlers):
+        super().__init__(queue.Queue(-1))
+        self._handlers = handlers
+        self.listener = None
+        self._start_listener()
+        _queue_handlers.add(self)
+    
+    def _start_listener(self):
+        """Start a listener on a new queue, dropping any inherited one."""
+        self.queue = queue.Queue(-1)
+        self.listener = logging.handlers.QueueListener(
+            self.queue, *self._handlers, respect_handler_level=True
+        )
+        self.listener.start()
+    
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+
+# Live queue handlers, restarted in forked children
+_queue_handlers = weakref.WeakSet()
+
+def _restart_listeners_in_child():
+    """Give each open queue handler a running listener after fork."""
+    for handler in list(_queue_handlers):
+        if handler.listener is not None:
+            handler._start_listener()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_in_child)
+
 def setup_logger(name="gitlab_api"):
     """
     Configure and return a logger with file and console handlers.
     
+    The logger itself only enqueues records; a background QueueListener
+    thread formats them and writes to the file and console handlers.
+    
     Args:
         name (str): Name of the logger.
         
@@ -18,10 +68,6 @@ def setup_logger(name="gitlab_api"):
     if not os.path.exists(LOG_DIR):
         os.makedirs(LOG_DIR)
         
-    # Create log filename with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_filename = f"{LOG_DIR}/gitlab_api_{timestamp}.log"
-    
     # Create logger
     logger = logging.getLogger(name)
     
@@ -31,8 +77,14 @@ def setup_logger(name="gitlab_api"):
     
     # Avoid adding handlers multiple times
     if not logger.handlers:
-        # Create file handler
-        file_handler = logging.FileHandler(log_filename)
+        # Create rotating file handler; the file is opened on first write
+        file_handler = logging.handlers.RotatingFileHandler(
+            f"{LOG_DIR}/gitlab_api.log",
+            maxBytes=10_000_000,
+            backupCount=5,
+            encoding='utf-8',
+            delay=True
+        )
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
         )
@@ -45,8 +97,7 @@ def setup_logger(name="gitlab_api"):
         )
         console_handler.setFormatter(console_formatter)
         
-        # Add handlers to logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Hand records to a background thread that owns the real handlers
+        logger.addHandler(_ListenerQueueHandler(file_handler, console_handler))
     
     return logger
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Asynchronous GitLab API client.
+
+This module provides an httpx-based client that fetches project listing pages
+concurrently on a single event loop, multiplexed over HTTP/2 where available.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import namedtuple
+
+import httpx
+import msgspec
+
+from api.cache import ResponseValidatorCache
+from api.schemas import decode_projects
+from config import GITLAB_API_URL, get_gitlab_token
+
+logger = logging.getLogger('gitlab_api.async_client')
+
+# Transient gateway errors retried with exponential backoff
+RETRY_STATUSES = (502, 503, 504)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+# One fetched page of the project listing; projects is None if the page
+# was answered with 304 Not Modified, and cacheable is False for pages that
+# are always requested without validators
+ProjectPage = namedtuple('ProjectPage', ['url', 'params', 'headers', 'projects', 'cacheable'])
+
+
+class AsyncGitLabApiClient:
+    """Asynchronous client for interacting with the GitLab API."""
+    
+    def __init__(self, api_url=GITLAB_API_URL, private_token=None, cache=None, max_connections=64):
+        """
+        Initialize asynchronous GitLab API client.
+        
+        Args:
+            api_url (str): GitLab API URL
+            private_token (str, optional): GitLab private token; defaults to
+                the token from ``config.get_gitlab_token()``
+            cache (ResponseValidatorCache, optional): Validator cache used to make
+                conditional requests for paginated project listings; the
+                client only reads it, callers persist the validators of
+                cacheable pages once their projects are stored
+            max_connections (int): Maximum number of concurrent requests, which
+                is also the number of pages fetched ahead of the consumer
+        """
+        if private_token is None:
+            private_token = get_gitlab_token()
+        
+        self.api_url = api_url
+        self.private_token = private_token
+        self.cache = cache
+        
+        # Validate configuration
+        if not self.api_url or not self.private_token:
+            logger.error("GitLab API URL or Private Token not configured")
+            raise ValueError("GitLab API URL or Private Token not configured")
+        
+        self._projects_url = f"{self.api_url.rstrip('/')}/projects"
+        self._project_params = {'per_page': 100, 'order_by': 'id', 'sort': 'asc'}
+        
+        self._max_in_flight = max_connections
+        self.client = httpx.AsyncClient(
+            headers={
+                "Private-Token": private_token,
+                "Accept": "application/json"
+            },
+            # Retry failed connection attempts on an HTTP/2-capable pool
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=max_connections),
+                retries=3
+            )
+        )
+    
+    async def aclose(self):
+        """Close the underlying HTTP client and release pooled connections."""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def _fetch_page(self, params, page, conditional=True, follow_links=False):
+        """
+        Fetch one page of projects.
+        
+        Responses with a status in ``RETRY_STATUSES`` are retried up to
+        ``MAX_RETRIES`` times with exponential backoff.
+        
+        Args:
+            params (dict): Listing query parameters
+            page (int): Page number
+            conditional (bool): Whether to send cached validators
+            follow_links (bool): Whether the listing is walked through
+                ``X-Next-Page``; a cached last page is then fetched
+                unconditionally, since a 304 for it can't reveal pages
+                added after it
+            
+        Returns:
+            ProjectPage: The fetched page
+        """
+        page_params = dict(params, page=page)
+        cached = None
+        if conditional and self.cache is not None:
+            cached = self.cache.get(self._projects_url, page_params)
+            if follow_links and cached and not cached.get('X-Next-Page'):
+                cached = None
+        headers = ResponseValidatorCache.conditional_headers(cached)
+        
+        for attempt in range(MAX_RETRIES + 1):
+            response = await self.client.get(self._projects_url, params=page_params, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            delay = RETRY_BACKOFF * 2 ** attempt
+            logger.warning(f"Page {page} returned {response.status_code}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+        
+        if cached and response.status_code == 304:
+            headers = ResponseValidatorCache.revalidated_headers(cached, response.headers)
+            return ProjectPage(self._projects_url, page_params, headers, None, True)
+        
+        response.raise_for_status()
+        # Validators of pages fetched unconditionally are never read back
+        cacheable = conditional and not (follow_links and not response.headers.get('X-Next-Page'))
+        return ProjectPage(
+            self._projects_url, page_params, response.headers, decode_projects(response.content), cacheable
+        )
+    
+    async def iter_project_pages(self, per_page=100, params=None):
+        """
+        Get all projects from the GitLab API, fetching pages concurrently.
+        
+        The first page is requested on its own, without validators, to read
+        the current ``X-Total-Pages`` header; the remaining pages are then
+        fetched through a window of at most ``max_connections`` in-flight
+        requests and yielded as soon as each one completes, so pages may
+        arrive out of order. Pages answered with ``304 Not Modified`` are
+        skipped. Validators are not stored; callers persist them for each
+        cacheable page once its projects have been saved.
+        
+        Args:
+            per_page (int): Number of projects per page (GitLab maximum is 100)
+            params (dict, optional): Additional query parameters for the API request,
+                merged over the default ordering by ID
+            
+        Yields:
+            ProjectPage: One changed page, with its project dictionaries
+            
+        Raises:
+            httpx.HTTPError: If API request fails
+            msgspec.DecodeError: If a page is not a JSON list of projects
+        """
+        base_params = {**self._project_params, **(params or {}), 'per_page': per_page}
+        unchanged_pages = 0
+        
+        try:
+            logger.info(f"Fetching projects from {self._projects_url} ({per_page} per page)")
+            first_page = await self._fetch_page(base_params, 1, conditional=False)
+            yield first_page
+            
+            total_pages = first_page.headers.get("X-Total-Pages")
+            if not total_pages:
+                # GitLab omits X-Total-Pages for very large result sets,
+                # so fall back to following X-Next-Page sequentially
+                next_page = first_page.headers.get("X-Next-Page")
+                while next_page:
+                    project_page = await self._fetch_page(base_params, int(next_page), follow_links=True)
+                    if project_page.projects is None:
+                        unchanged_pages += 1
+                    else:
+                        yield project_page
+                    next_page = project_page.headers.get("X-Next-Page")
+            else:
+                total_pages = int(total_pages)
+                logger.info(f"Fetching {total_pages} pages of projects concurrently")
+                
+                pages = iter(range(2, total_pages + 1))
+                pending = set()
+                try:
+                    while True:
+                        # Top the window up, so only a bounded number of pages
+                        # are downloaded ahead of the consumer
+                        for page in itertools.islice(pages, self._max_in_flight - len(pending)):
+                            pending.add(asyncio.ensure_future(self._fetch_page(base_params, page)))
+                        if not pending:
+                            break
+                        
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            project_page = task.result()
+                            if project_page.projects is None:
+                                unchanged_pages += 1
+                            else:
+                                yield project_page
+                finally:
+                    # Don't leave requests running if iteration stops early
+                    for task in pending:
+                        task.cancel()
+            
+            if unchanged_pages:
+                logger.info(f"Skipped {unchanged_pages} unchanged pages of projects")
+        
+        except (httpx.HTTPError, msgspec.DecodeError) as e:
+            logger.error(f"Error fetching projects from GitLab API: {str(e)}")
+            # Re-raise exception after logging
+            raise
+    
+    async def get_projects_all(self, per_page=100, params=None):
+        """
+        Get all projects from the GitLab API as a single list.
+        
+        Args:
+            per_page (int): Number of projects per page (GitLab maximum is 100)
+            params (dict, optional): Additional query parameters for the API request
+            
+        Returns:
+            list: List of project dictionaries
+            
+        Raises:
+            httpx.HTTPError: If API request fails
+        """
+        return [
+            project
+            async for page in self.iter_project_pages(per_page=per_page, params=params)
+            for project in page.projects
+        ]
@@ -0,0 +1,115 @@
+"""
+Typed schemas for GitLab API payloads.
+
+This module defines msgspec Structs covering only the project and namespace
+fields the application persists, so responses are decoded by a schema-aware
+decoder that skips every other field GitLab returns.
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional, Union
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+logger = logging.getLogger('gitlab_api.schemas')
+
+
+class GitLabNamespace(msgspec.Struct):
+    """Namespace embedded in a GitLab project payload."""
+    
+    id: int
+    name: str
+    path: Union[Optional[str], UnsetType] = UNSET
+    kind: Union[Optional[str], UnsetType] = UNSET
+    full_path: Union[Optional[str], UnsetType] = UNSET
+    parent_id: Union[Optional[int], UnsetType] = UNSET
+    web_url: Union[Optional[str], UnsetType] = UNSET
+
+
+class GitLabProject(msgspec.Struct):
+    """
+    GitLab project payload, limited to the fields stored in the database.
+    
+    Fields missing from the payload are left UNSET rather than given a default,
+    so the database model's own column defaults still apply.
+    """
+    
+    id: int
+    name: str
+    description: Union[Optional[str], UnsetType] = UNSET
+    name_with_namespace: Union[Optional[str], UnsetType] = UNSET
+    path: Union[Optional[str], UnsetType] = UNSET
+    path_with_namespace: Union[Optional[str], UnsetType] = UNSET
+    web_url: Union[Optional[str], UnsetType] = UNSET
+    ssh_url_to_repo: Union[Optional[str], UnsetType] = UNSET
+    http_url_to_repo: Union[Optional[str], UnsetType] = UNSET
+    created_at: Union[Optional[datetime], UnsetType] = UNSET
+    last_activity_at: Union[Optional[datetime], UnsetType] = UNSET
+    updated_at: Union[Optional[datetime], UnsetType] = UNSET
+    visibility: Union[Optional[str], UnsetType] = UNSET
+    archived: Union[Optional[bool], UnsetType] = UNSET
+    empty_repo: Union[Optional[bool], UnsetType] = UNSET
+    issues_enabled: Union[Optional[bool], UnsetType] = UNSET
+    merge_requests_enabled: Union[Optional[bool], UnsetType] = UNSET
+    wiki_enabled: Union[Optional[bool], UnsetType] = UNSET
+    namespace: Union[Optional[GitLabNamespace], UnsetType] = UNSET
+
+
+# Reusable decoder for a page of the /projects listing
+_project_list_decoder = msgspec.json.Decoder(list[GitLabProject])
+
+
+def _asdict(struct):
+    """Return the fields of a struct that were present in the payload."""
+    return {k: v for k, v in msgspec.structs.asdict(struct).items() if v is not UNSET}
+
+
+def to_dict(project):
+    """
+    Convert a decoded project, including its namespace, into plain dicts.
+    
+    Fields that were missing from the payload are omitted.
+    
+    Args:
+        project (GitLabProject): Decoded project
+        
+    Returns:
+        dict: Project fields, with the namespace as a nested dict
+    """
+    data = _asdict(project)
+    if data.get('namespace') is not None:
+        data['namespace'] = _asdict(data['namespace'])
+    return data
+
+
+def decode_projects(content):
+    """
+    Decode a page of the /projects listing.
+    
+    Projects that don't match the schema are logged and skipped.
+    
+    Args:
+        content (bytes): Response body
+        
+    Returns:
+        list: Project dictionaries holding only the declared fields, with
+        timestamps already parsed
+        
+    Raises:
+        msgspec.DecodeError: If the body is not a JSON list
+    """
+    try:
+        projects = _project_list_decoder.decode(content)
+    except msgspec.ValidationError as e:
+        # Decode item by item so a malformed project only loses itself
+        logger.warning(f"Decoding projects one at a time: {str(e)}")
+        projects = []
+        for item in msgspec.json.decode(content, type=list):
+            try:
+                projects.append(msgspec.convert(item, GitLabProject))
+            except msgspec.ValidationError as item_error:
+                project_id = item.get('id') if isinstance(item, dict) else None
+                logger.error(f"Skipping project {project_id}: {str(item_error)}")
+    return [to_dict(project) for project in projects]
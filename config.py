@@ -1,17 +1,30 @@
 """
 Configuration module for the GitLab API data extraction application.
 
-Instead of retrieving the token from an environment variable, 
-the application prompts the user to enter the token at runtime (without hardcoding it).
+The private token is never hardcoded: it is read from the GITLAB_PRIVATE_TOKEN
+environment variable if set, otherwise the user is prompted for it the first
+time it is needed (not at import time).
 """
 
 
+import os
 import getpass
 
 GITLAB_API_URL = "https://gitlab.boon.com.au/api/v4"
 
-token = getpass.getpass("Private Token: ")
-GITLAB_PRIVATE_TOKEN = token
+_token = None
+
+def get_gitlab_token():
+    """
+    Return the GitLab private token, prompting for it on first use.
+    
+    Returns:
+        str: GitLab private token
+    """
+    global _token
+    if _token is None:
+        _token = os.environ.get("GITLAB_PRIVATE_TOKEN") or getpass.getpass("Private Token: ")
+    return _token
 
 DATABASE_URI = "sqlite:///gitlab_data.db"
 
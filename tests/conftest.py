@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the GitLab API data extraction tests."""
+
+import os
+import sys
+
+# Make the application modules importable as top-level packages, as app.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
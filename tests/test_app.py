@@ -0,0 +1,174 @@
+"""Tests for the fetch-and-store pipeline in app.py."""
+
+import functools
+import hashlib
+import importlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from api.async_client import AsyncGitLabApiClient
+from sqlalchemy import delete
+
+from database.models import Project, init_db
+from database.operations import ProjectRepository
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # app sets up file logging on import, so keep logs/ inside tmp_path
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("app")
+    monkeypatch.setattr(module, "DATABASE_URI", f"sqlite:///{tmp_path}/projects.db")
+    return module
+
+
+class _GitLab(BaseHTTPRequestHandler):
+    """Minimal /projects listing with ETag validators."""
+
+    projects = []
+    # GitLab omits X-Total-Pages for very large listings
+    send_total_pages = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        per_page = int(query["per_page"][0])
+        page = int(query.get("page", ["1"])[0])
+        total_pages = max(1, -(-len(self.projects) // per_page))
+        body = json.dumps(self.projects[(page - 1) * per_page:page * per_page]).encode()
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+
+        self.send_response(304 if self.headers.get("If-None-Match") == etag else 200)
+        self.send_header("ETag", etag)
+        if self.send_total_pages:
+            self.send_header("X-Total-Pages", str(total_pages))
+        self.send_header("X-Next-Page", str(page + 1) if page < total_pages else "")
+        if self.headers.get("If-None-Match") == etag:
+            self.end_headers()
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def gitlab(app, monkeypatch):
+    handler = type("GitLab", (_GitLab,), {"projects": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(app, "AsyncGitLabApiClient", functools.partial(
+        AsyncGitLabApiClient, api_url=f"http://127.0.0.1:{server.server_port}/api", private_token="token"
+    ))
+    yield handler
+    server.shutdown()
+    server.server_close()
+
+
+def _projects(first, last):
+    return [{"id": i, "name": f"p{i}"} for i in range(first, last + 1)]
+
+
+def _stored_count(app):
+    session = init_db(app.DATABASE_URI)
+    try:
+        return session.query(Project).count()
+    finally:
+        session.close()
+
+
+def test_store_projects_skips_only_bad_rows(app):
+    session = init_db(app.DATABASE_URI)
+    repo = ProjectRepository(session)
+    # name is NOT NULL, so project 2 fails the batch insert
+    projects = [{'id': 1, 'name': 'p1'}, {'id': 2, 'name': None}, {'id': 3, 'name': 'p3'}]
+
+    assert app._store_projects(repo, projects) == (2, False)
+    assert [project.id for project in repo.get_all_projects()] == [1, 3]
+    session.close()
+
+
+def test_new_pages_are_fetched_when_cached_pages_are_unchanged(app, gitlab):
+    gitlab.projects = _projects(1, 300)
+    assert app.fetch_and_store_projects() == 300
+
+    # Pages 2-3 answer 304; page 1 must still report the new page 4
+    gitlab.projects = _projects(1, 350)
+    assert app.fetch_and_store_projects() == 150
+    assert _stored_count(app) == 350
+
+
+def test_new_pages_are_fetched_when_following_next_page_links(app, gitlab):
+    gitlab.send_total_pages = False
+    gitlab.projects = _projects(1, 300)
+    assert app.fetch_and_store_projects() == 300
+
+    # Page 2 answers 304; the old last page is refetched to find page 4
+    gitlab.projects = _projects(1, 350)
+    assert app.fetch_and_store_projects() == 250
+    assert _stored_count(app) == 350
+
+
+def test_pages_with_missing_rows_are_fetched_again(app, gitlab):
+    gitlab.projects = _projects(1, 300)
+    assert app.fetch_and_store_projects() == 300
+
+    session = init_db(app.DATABASE_URI)
+    repo = ProjectRepository(session)
+    repo.delete_project(150)
+    # Page 2 comes back in full for the deleted project; page 3 answers 304
+    assert app.fetch_and_store_projects() == 200
+    assert repo.get_project_by_id(150) is not None
+
+    session.execute(delete(Project))
+    session.commit()
+    session.close()
+    assert app.fetch_and_store_projects() == 300
+    assert _stored_count(app) == 300
+
+
+def test_validators_are_kept_only_for_stored_pages(app, gitlab, monkeypatch):
+    gitlab.projects = _projects(1, 300)
+
+    def crash(self, projects):
+        raise KeyboardInterrupt
+
+    # A crash before the first commit must not leave pages marked as seen
+    with monkeypatch.context() as patch:
+        patch.setattr(ProjectRepository, "bulk_save_projects", crash)
+        with pytest.raises(KeyboardInterrupt):
+            app.fetch_and_store_projects()
+    assert _stored_count(app) == 0
+
+    assert app.fetch_and_store_projects() == 300
+    assert _stored_count(app) == 300
+
+
+def test_writer_failure_with_full_queue_does_not_hang(app, gitlab, monkeypatch):
+    # Far more pages than the queue holds, so the producer is blocked on put
+    gitlab.projects = _projects(1, 6000)
+
+    def fail(project_repo, pages):
+        time.sleep(0.5)
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(app, "_store_pages", fail)
+    errors = []
+
+    def run():
+        try:
+            app.fetch_and_store_projects()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+    assert [str(e) for e in errors] == ["database unavailable"]
@@ -0,0 +1,32 @@
+"""Tests for the queue-based logger setup."""
+
+import logging
+import os
+
+import pytest
+
+from utils.logger import setup_logger
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+def test_forked_child_logs_reach_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = setup_logger("gitlab_api.test_fork")
+    logger.info("from parent")
+    
+    pid = os.fork()
+    if pid == 0:
+        # Mimic Airflow's task runner: log, shut logging down, hard exit
+        try:
+            logger.info("from child")
+            logging.shutdown()
+        finally:
+            os._exit(0)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    
+    for handler in logger.handlers:
+        handler.close()
+    log_text = (tmp_path / "logs" / "gitlab_api.log").read_text(encoding="utf-8")
+    assert "from parent" in log_text
+    assert "from child" in log_text
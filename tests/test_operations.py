@@ -0,0 +1,27 @@
+from database.models import Namespace, init_db
+from database.operations import ProjectRepository
+
+
+def _project(project_id, name, namespace_name):
+    return {
+        'id': project_id,
+        'name': name,
+        'created_at': '2024-01-01T10:00:00Z',
+        'namespace': {'id': 10, 'name': namespace_name, 'path': 'group', 'kind': 'group'},
+    }
+
+
+def test_bulk_save_updates_renamed_namespace(tmp_path):
+    session = init_db(f"sqlite:///{tmp_path}/projects.db")
+    repo = ProjectRepository(session)
+
+    assert repo.bulk_save_projects([_project(1, 'p1', 'Group'), _project(2, 'p2', 'Group')]) == 2
+    assert repo.bulk_save_projects([_project(2, 'p2 renamed', 'Renamed Group')]) == 1
+
+    namespace = session.get(Namespace, 10)
+    session.refresh(namespace)
+    assert namespace.name == 'Renamed Group'
+    assert namespace.path == 'group'
+    assert namespace.project_id == 1
+    assert repo.get_project_by_id(2).name == 'p2 renamed'
+    session.close()
@@ -0,0 +1,35 @@
+"""Tests for decoding GitLab API payloads."""
+
+import json
+
+import msgspec
+import pytest
+
+from api.schemas import decode_projects
+
+
+def _page(*projects):
+    return json.dumps(list(projects)).encode()
+
+
+def test_decode_projects_accepts_null_flags():
+    projects = decode_projects(_page({'id': 1, 'name': 'p1', 'archived': None, 'empty_repo': None}))
+
+    assert projects == [{'id': 1, 'name': 'p1', 'archived': None, 'empty_repo': None}]
+
+
+def test_decode_projects_skips_only_malformed_projects():
+    projects = decode_projects(_page(
+        {'id': 1, 'name': 'p1', 'created_at': '2024-01-01T10:00:00Z'},
+        {'id': 2, 'name': 'p2', 'wiki_enabled': 'yes'},
+        {'id': 3, 'name': 'p3', 'namespace': {'id': 10, 'name': 'group'}},
+    ))
+
+    assert [project['id'] for project in projects] == [1, 3]
+    assert projects[0]['created_at'].year == 2024
+    assert projects[1]['namespace'] == {'id': 10, 'name': 'group'}
+
+
+def test_decode_projects_rejects_non_list_body():
+    with pytest.raises(msgspec.DecodeError):
+        decode_projects(b'{"message": "401 Unauthorized"}')